@@ -15,12 +15,12 @@ from __future__ import annotations
 import os
 import sqlite3
 import time
-from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional
 
-from flask import Flask, Response, jsonify, render_template_string, request, send_file
+from flask import Flask, Response, jsonify, request, send_file
 
 
 APP_DIR = Path(__file__).resolve().parent
@@ -30,6 +30,8 @@ DB_PATH = STORAGE_DIR / "analytics.db"
 PIXEL_PATH = ASSETS_DIR / "pixel.png"
 
 
+# /api/hits re-formats the same epoch seconds on every UI refresh.
+@lru_cache(maxsize=4096)
 def utc_iso(ts: int) -> str:
     return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
 
@@ -371,10 +373,14 @@ UI_HTML = """\
 </html>
 """
 
+# UI_HTML has no template placeholders, so encode it once instead of running
+# it through Jinja on every request.
+UI_HTML_BYTES = UI_HTML.encode("utf-8")
+
 
 @app.get("/")
 def ui() -> Response:
-    return Response(render_template_string(UI_HTML), mimetype="text/html; charset=utf-8")
+    return Response(UI_HTML_BYTES, mimetype="text/html; charset=utf-8")
 
 
 def main() -> None:
@@ -37,8 +37,11 @@ def main() -> int:
 
     base = args.base_url.rstrip("/")
     filt = args.id.strip()
+    interval_ns = int(max(0.25, args.interval) * 1_000_000_000)
+    next_ns = time.monotonic_ns()
 
     while True:
+        next_ns += interval_ns
         try:
             stats = fetch_json(f"{base}/api/stats")
             qs = {"limit": str(max(1, min(args.limit, 200)))}
@@ -77,7 +80,13 @@ def main() -> int:
             print("Start it with:")
             print("  python3 analytics/backend.py")
 
-        time.sleep(max(0.25, args.interval))
+        # Pace refreshes against a fixed integer-ns schedule so fetch/render time
+        # does not stretch the interval; resync if we fell a whole period behind.
+        now_ns = time.monotonic_ns()
+        if next_ns > now_ns:
+            time.sleep((next_ns - now_ns) / 1_000_000_000)
+        else:
+            next_ns = now_ns
 
 
 if __name__ == "__main__":
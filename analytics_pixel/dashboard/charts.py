@@ -24,7 +24,7 @@ def draw_line_chart(
     if grid:
         for i in range(1, 4):
             y = rect.y + (rect.h * i) // 4
-            pygame.draw.line(surf, (35, 39, 48), (rect.x + 10, y), (rect.x + rect.w - 10, y), 1)
+            pygame.draw.line(surf, Theme.GRID, (rect.x + 10, y), (rect.x + rect.w - 10, y), 1)
 
     if len(points) < 2:
         return
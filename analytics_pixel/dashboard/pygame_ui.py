@@ -1,17 +1,36 @@
 from __future__ import annotations
 
-import json
 import time
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
 import pygame
-import pyperclip
 import requests
 
 from .charts import draw_line_chart
 from .theme import Theme
 
+REFRESH_EVERY_NS = 2_000_000_000  # auto-poll period (2s)
+
+# Static layout, built once instead of on every frame.
+_TABLE_RECT = pygame.Rect(30, 240, 560, 450)
+_TABLE_CLIP = _TABLE_RECT.inflate(-10, -50)
+_CHART_RECT = pygame.Rect(610, 240, 560, 180)
+_EMBED_PANEL_RECT = pygame.Rect(610, 440, 560, 250)
+_CARD_RECTS = (
+    pygame.Rect(30, 130, 180, 90),
+    pygame.Rect(220, 130, 220, 90),
+    pygame.Rect(450, 130, 180, 90),
+)
+# (label, embed key, hint) for the copy buttons, paired with _COPY_RECTS.
+_COPY_BUTTONS = (
+    ("BBCode", "bbcode", "[img].../p/<id>.png[/img]"),
+    ("BBCode+tag", "bbcode_with_tag", "[img].../p/<id>.png?tag=campaign[/img]"),
+    ("Glyph BBCode", "bbcode_glyph", "[img].../g/<id>.png?text=•[/img]"),
+    ("Pixel URL", "pixel_url", ".../p/<id>.png"),
+)
+_COPY_RECTS = tuple(pygame.Rect(650, 300 + i * 44, 220, 34) for i in range(len(_COPY_BUTTONS)))
+
 
 @dataclass
 class ServerState:
@@ -20,18 +39,37 @@ class ServerState:
     username: str = "admin"
     password: str = ""
     message: str = ""
-    last_refresh: float = 0.0
+    last_refresh_ns: int = 0
 
 
 def _text(font: pygame.font.Font, s: str, color=Theme.TEXT) -> pygame.Surface:
     return font.render(s, True, color)
 
 
+def _load_fonts() -> Tuple[pygame.font.Font, pygame.font.Font, pygame.font.Font]:
+    # Resolve Segoe UI once for the two regular sizes. match_font() returns None
+    # when it is not installed, which selects pygame's bundled default font (the
+    # same fallback SysFont uses). The heading stays on SysFont so it loads the
+    # real bold face and only falls back to synthetic bold when there is none.
+    path = pygame.font.match_font("segoeui")
+    font_big = pygame.font.SysFont("Segoe UI", 28, bold=True)
+    return pygame.font.Font(path, 18), pygame.font.Font(path, 14), font_big
+
+
 def _clip_copy(s: str) -> None:
-    # pyperclip gives reliable copy/paste on Linux compared to pygame.scrap
+    # pyperclip gives reliable copy/paste on Linux compared to pygame.scrap.
+    # Imported on first use so startup does not pay for it.
+    import pyperclip
+
     pyperclip.copy(s)
 
 
+def _clip_paste() -> str:
+    import pyperclip
+
+    return pyperclip.paste()
+
+
 def _auth_headers(state: ServerState) -> Dict[str, str]:
     if not state.token:
         return {}
@@ -67,7 +105,7 @@ class InputBox:
                 pass
             elif e.key == pygame.K_v and (e.mod & pygame.KMOD_CTRL):
                 try:
-                    self.text += pyperclip.paste()
+                    self.text += _clip_paste()
                 except Exception:
                     pass
             else:
@@ -96,7 +134,7 @@ class Button:
         return False
 
     def draw(self, surf: pygame.Surface, font: pygame.font.Font) -> None:
-        color = (40, 45, 55) if not self.hover else (55, 62, 75)
+        color = Theme.BUTTON_HOVER if self.hover else Theme.BUTTON
         pygame.draw.rect(surf, color, self.rect, border_radius=10)
         pygame.draw.rect(surf, Theme.BORDER, self.rect, width=1, border_radius=10)
         txt = _text(font, self.text)
@@ -109,9 +147,7 @@ def run_dashboard() -> None:
 
     screen = pygame.display.set_mode((1200, 720))
     clock = pygame.time.Clock()
-    font = pygame.font.SysFont("Segoe UI", 18)
-    font_small = pygame.font.SysFont("Segoe UI", 14)
-    font_big = pygame.font.SysFont("Segoe UI", 28, bold=True)
+    font, font_small, font_big = _load_fonts()
 
     state = ServerState()
 
@@ -137,6 +173,7 @@ def run_dashboard() -> None:
     selected_embed: Optional[Dict[str, str]] = None
 
     scroll = 0
+    sel_rect = pygame.Rect(0, 0, 0, 0)  # scratch rect for the selected-row highlight
 
     def refresh() -> None:
         nonlocal summary, pixels, series, events, selected_embed
@@ -155,7 +192,7 @@ def run_dashboard() -> None:
                 series = t["json"].get("series", [])
             if e["status"] == 200:
                 events = e["json"].get("events", [])
-            state.last_refresh = time.time()
+            state.last_refresh_ns = time.monotonic_ns()
             state.message = "Refreshed."
             # keep embed info if selection still exists
             if selected_pixel_id:
@@ -173,10 +210,16 @@ def run_dashboard() -> None:
         }
 
     running = True
+    # Everything on screen changes only through an input event or a refresh(),
+    # so idle frames skip the fill/draw/flip entirely.
+    dirty = True
     while running:
         dt = clock.tick(60) / 1000.0
 
-        for e in pygame.event.get():
+        pending = pygame.event.get()
+        if pending:
+            dirty = True
+        for e in pending:
             if e.type == pygame.QUIT:
                 running = False
 
@@ -240,10 +283,9 @@ def run_dashboard() -> None:
             # Click selection + copy actions in table
             if e.type == pygame.MOUSEBUTTONDOWN and e.button == 1:
                 mx, my = e.pos
-                table_rect = pygame.Rect(30, 240, 560, 450)
-                if table_rect.collidepoint(mx, my):
+                if _TABLE_RECT.collidepoint(mx, my):
                     row_h = 30
-                    idx = (my - table_rect.y + scroll) // row_h - 1  # header row
+                    idx = (my - _TABLE_RECT.y + scroll) // row_h - 1  # header row
                     if 0 <= idx < len(pixels):
                         selected_pixel_id = str(pixels[idx].get("pixel_id"))
                         selected_embed = _make_embed(selected_pixel_id)
@@ -251,25 +293,22 @@ def run_dashboard() -> None:
 
                 # Copy buttons
                 if selected_embed:
-                    y0 = 300
-                    copy_rects = [
-                        ("BBCode", pygame.Rect(650, y0, 220, 34), selected_embed["bbcode"]),
-                        ("BBCode+tag", pygame.Rect(650, y0 + 44, 220, 34), selected_embed["bbcode_with_tag"]),
-                        ("Glyph BBCode", pygame.Rect(650, y0 + 88, 220, 34), selected_embed["bbcode_glyph"]),
-                        ("Pixel URL", pygame.Rect(650, y0 + 132, 220, 34), selected_embed["pixel_url"]),
-                    ]
-                    for label, rect, val in copy_rects:
+                    for (label, key, _hint), rect in zip(_COPY_BUTTONS, _COPY_RECTS):
                         if rect.collidepoint(mx, my):
                             try:
-                                _clip_copy(val)
+                                _clip_copy(selected_embed[key])
                                 state.message = f"Copied {label} to clipboard."
                             except Exception as ex:
                                 state.message = f"Copy failed: {ex}"
 
-        # Auto-poll (simple)
-        refresh_every = 2.0
-        if state.token and time.time() - state.last_refresh > refresh_every:
+        # Auto-poll (simple). Monotonic integer clock: immune to wall-clock jumps.
+        if state.token and time.monotonic_ns() - state.last_refresh_ns > REFRESH_EVERY_NS:
             refresh()
+            dirty = True
+
+        if not dirty:
+            continue
+        dirty = False
 
         # ---- draw ----
         screen.fill(Theme.BG)
@@ -290,16 +329,15 @@ def run_dashboard() -> None:
             screen.blit(_text(font_small, state.message, Theme.MUTED), (30, 700))
 
         # Summary cards
-        def card(x: int, y: int, w: int, h: int, title: str, value: str) -> None:
-            r = pygame.Rect(x, y, w, h)
+        def card(r: pygame.Rect, title: str, value: str) -> None:
             pygame.draw.rect(screen, Theme.PANEL, r, border_radius=12)
             pygame.draw.rect(screen, Theme.BORDER, r, width=1, border_radius=12)
-            screen.blit(_text(font_small, title, Theme.MUTED), (x + 14, y + 10))
-            screen.blit(_text(font_big, value, Theme.TEXT), (x + 14, y + 32))
+            screen.blit(_text(font_small, title, Theme.MUTED), (r.x + 14, r.y + 10))
+            screen.blit(_text(font_big, value, Theme.TEXT), (r.x + 14, r.y + 32))
 
-        card(30, 130, 180, 90, "Total hits", str(summary.get("total_hits", 0)))
-        card(220, 130, 220, 90, "Unique visitors (hashed)", str(summary.get("unique_visitors", 0)))
-        card(450, 130, 180, 90, "Pixels", str(summary.get("pixel_count", 0)))
+        card(_CARD_RECTS[0], "Total hits", str(summary.get("total_hits", 0)))
+        card(_CARD_RECTS[1], "Unique visitors (hashed)", str(summary.get("unique_visitors", 0)))
+        card(_CARD_RECTS[2], "Pixels", str(summary.get("pixel_count", 0)))
 
         # Create pixel row
         inp_new_pixel.draw(screen, font, "New Pixel ID")
@@ -308,7 +346,7 @@ def run_dashboard() -> None:
         btn_refresh.draw(screen, font)
 
         # Pixels table
-        table = pygame.Rect(30, 240, 560, 450)
+        table = _TABLE_RECT
         pygame.draw.rect(screen, Theme.PANEL, table, border_radius=12)
         pygame.draw.rect(screen, Theme.BORDER, table, width=1, border_radius=12)
 
@@ -324,7 +362,7 @@ def run_dashboard() -> None:
         content_top = table.y + 40
         row_h = 30
         clip = screen.get_clip()
-        screen.set_clip(table.inflate(-10, -50))
+        screen.set_clip(_TABLE_CLIP)
         for i, row in enumerate(pixels):
             y = content_top + i * row_h - scroll
             rid = str(row.get("pixel_id", ""))
@@ -332,7 +370,8 @@ def run_dashboard() -> None:
                 continue
             is_sel = (selected_pixel_id == rid)
             if is_sel:
-                pygame.draw.rect(screen, (40, 55, 75), pygame.Rect(table.x + 8, y, table.w - 16, row_h), border_radius=8)
+                sel_rect.update(table.x + 8, y, table.w - 16, row_h)
+                pygame.draw.rect(screen, Theme.SELECTED, sel_rect, border_radius=8)
             screen.blit(_text(font_small, rid, Theme.TEXT), (col_x[0], y + 6))
             screen.blit(_text(font_small, str(row.get("label", ""))[:20], Theme.MUTED), (col_x[1], y + 6))
             screen.blit(_text(font_small, str(row.get("hits", 0)), Theme.TEXT), (col_x[2], y + 6))
@@ -340,21 +379,21 @@ def run_dashboard() -> None:
         screen.set_clip(clip)
 
         # Chart
-        chart_rect = pygame.Rect(610, 240, 560, 180)
-        # Scale series into points
-        hits_vals = [int(p.get("hits", 0)) for p in series] if series else []
+        chart_rect = _CHART_RECT
+        # Scale series into points (hits parsed once, loop invariants hoisted)
+        hits_vals = [int(p.get("hits", 0)) for p in series]
         maxv = max(hits_vals) if hits_vals else 1
-        pts: List[Tuple[int, int]] = []
-        if series:
-            for i, p in enumerate(series):
-                x = chart_rect.x + 20 + int((chart_rect.w - 40) * (i / max(1, len(series) - 1)))
-                y = chart_rect.y + chart_rect.h - 20 - int((chart_rect.h - 40) * (int(p.get("hits", 0)) / maxv))
-                pts.append((x, y))
+        x0, x_span = chart_rect.x + 20, chart_rect.w - 40
+        y0, y_span = chart_rect.y + chart_rect.h - 20, chart_rect.h - 40
+        steps = max(1, len(hits_vals) - 1)
+        pts: List[Tuple[int, int]] = [
+            (x0 + int(x_span * (i / steps)), y0 - int(y_span * (v / maxv))) for i, v in enumerate(hits_vals)
+        ]
         draw_line_chart(screen, chart_rect, points=pts, color=Theme.ACCENT)
         screen.blit(_text(font_small, "Hits (last 48 hours, hourly buckets)", Theme.MUTED), (chart_rect.x + 14, chart_rect.y + 10))
 
         # Embed/copy panel
-        panel = pygame.Rect(610, 440, 560, 250)
+        panel = _EMBED_PANEL_RECT
         pygame.draw.rect(screen, Theme.PANEL, panel, border_radius=12)
         pygame.draw.rect(screen, Theme.BORDER, panel, width=1, border_radius=12)
         screen.blit(_text(font, "Embed / Copy", Theme.TEXT), (panel.x + 14, panel.y + 12))
@@ -364,27 +403,13 @@ def run_dashboard() -> None:
             screen.blit(_text(font_small, f"Selected: {selected_pixel_id}", Theme.MUTED), (panel.x + 14, panel.y + 44))
 
             # Copy buttons
-            y0 = 300
-            btns = [
-                ("BBCode", "[img].../p/<id>.png[/img]"),
-                ("BBCode+tag", "[img].../p/<id>.png?tag=campaign[/img]"),
-                ("Glyph BBCode", "[img].../g/<id>.png?text=•[/img]"),
-                ("Pixel URL", ".../p/<id>.png"),
-            ]
-            rects = [
-                pygame.Rect(650, y0, 220, 34),
-                pygame.Rect(650, y0 + 44, 220, 34),
-                pygame.Rect(650, y0 + 88, 220, 34),
-                pygame.Rect(650, y0 + 132, 220, 34),
-            ]
-            for (label, hint), r in zip(btns, rects):
-                pygame.draw.rect(screen, (40, 45, 55), r, border_radius=10)
+            for (label, _key, hint), r in zip(_COPY_BUTTONS, _COPY_RECTS):
+                pygame.draw.rect(screen, Theme.BUTTON, r, border_radius=10)
                 pygame.draw.rect(screen, Theme.BORDER, r, width=1, border_radius=10)
                 screen.blit(_text(font_small, f"Copy {label}", Theme.TEXT), (r.x + 12, r.y + 8))
                 screen.blit(_text(font_small, hint, Theme.MUTED), (r.x + 240, r.y + 8))
 
         # Recent hits (shows identifiable data if stored)
-        recent = pygame.Rect(610, 430, 560, 0)  # just a label line above panel
         screen.blit(_text(font, "Recent hits (raw if available)", Theme.TEXT), (610 + 14, 420))
         y = 448
         for ev in events[:6]:
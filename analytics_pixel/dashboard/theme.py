@@ -12,3 +12,7 @@ class Theme:
     GOOD = (95, 200, 140)
     BAD = (255, 95, 95)
     BORDER = (50, 55, 65)
+    GRID = (35, 39, 48)
+    BUTTON = (40, 45, 55)
+    BUTTON_HOVER = (55, 62, 75)
+    SELECTED = (40, 55, 75)
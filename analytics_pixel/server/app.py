@@ -1,8 +1,8 @@
 from __future__ import annotations
 
+import json
 import os
 import time
-from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
 import yaml
@@ -35,6 +35,24 @@ def _client_ip(trust_proxy_headers: bool) -> str:
     return request.remote_addr or ""
 
 
+# Fixed {"error": ...} envelopes, serialized once. A fresh Response is built per
+# call so no mutable response object is shared between requests.
+_ERROR_BODIES: Dict[str, bytes] = {
+    code: (json.dumps({"error": code}, separators=(",", ":")) + "\n").encode("utf-8")
+    for code in (
+        "setup_disabled",
+        "username_and_password_required",
+        "invalid_credentials",
+        "unauthorized",
+        "pixel_id_required",
+    )
+}
+
+
+def _error_response(code: str, status: int) -> Response:
+    return Response(_ERROR_BODIES[code], status=status, mimetype="application/json")
+
+
 def _bearer_token() -> Optional[str]:
     authz = request.headers.get("Authorization", "")
     if authz.lower().startswith("bearer "):
@@ -167,13 +185,13 @@ def create_app() -> Flask:
         Disabled once at least one user exists.
         """
         if db.user_count() > 0:
-            return jsonify({"error": "setup_disabled"}), 403
+            return _error_response("setup_disabled", 403)
 
         payload = request.get_json(force=True, silent=True) or {}
         username = str(payload.get("username", "")).strip()
         password = str(payload.get("password", "")).strip()
         if not username or not password:
-            return jsonify({"error": "username_and_password_required"}), 400
+            return _error_response("username_and_password_required", 400)
 
         uid = db.create_user(username=username, password_hash=hash_password(password))
         token = create_session(db=db, hashing_cfg=hashing_cfg, auth_cfg=auth_cfg, user_id=uid)
@@ -186,7 +204,7 @@ def create_app() -> Flask:
         password = str(payload.get("password", "")).strip()
         user = db.get_user_by_username(username)
         if not user or not verify_password(str(user["password_hash"]), password):
-            return jsonify({"error": "invalid_credentials"}), 401
+            return _error_response("invalid_credentials", 401)
         token = create_session(db=db, hashing_cfg=hashing_cfg, auth_cfg=auth_cfg, user_id=int(user["id"]))
         return jsonify({"ok": True, "token": token})
 
@@ -200,19 +218,19 @@ def create_app() -> Flask:
     @app.get("/api/stats/summary")
     def stats_summary() -> Response:
         if require_auth() is None:
-            return jsonify({"error": "unauthorized"}), 401
+            return _error_response("unauthorized", 401)
         return jsonify(db.totals())
 
     @app.get("/api/stats/pixels")
     def stats_pixels() -> Response:
         if require_auth() is None:
-            return jsonify({"error": "unauthorized"}), 401
+            return _error_response("unauthorized", 401)
         return jsonify({"pixels": db.hits_per_pixel()})
 
     @app.get("/api/stats/timeseries")
     def stats_timeseries() -> Response:
         if require_auth() is None:
-            return jsonify({"error": "unauthorized"}), 401
+            return _error_response("unauthorized", 401)
         bucket = request.args.get("bucket", default="hour", type=str)
         hours = int(request.args.get("hours", default=48, type=int))
         since_ts = int(time.time()) - max(1, hours) * 3600
@@ -221,7 +239,7 @@ def create_app() -> Flask:
     @app.get("/api/events/recent")
     def events_recent() -> Response:
         if require_auth() is None:
-            return jsonify({"error": "unauthorized"}), 401
+            return _error_response("unauthorized", 401)
         limit = int(request.args.get("limit", default=200, type=int))
         limit = max(1, min(1000, limit))
         return jsonify({"events": db.recent_hits(limit=limit)})
@@ -230,13 +248,13 @@ def create_app() -> Flask:
     def pixels_create() -> Response:
         uid = require_auth()
         if uid is None:
-            return jsonify({"error": "unauthorized"}), 401
+            return _error_response("unauthorized", 401)
 
         payload = request.get_json(force=True, silent=True) or {}
         pixel_id = str(payload.get("pixel_id", "")).strip()
         label = str(payload.get("label", "")).strip() or None
         if not pixel_id:
-            return jsonify({"error": "pixel_id_required"}), 400
+            return _error_response("pixel_id_required", 400)
 
         db.create_pixel(pixel_id=pixel_id, label=label)
 
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
 import secrets
-import time
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import Optional
 
 from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import hashlib
 from dataclasses import dataclass
-from typing import Literal, Optional, Tuple
+from functools import lru_cache
+from typing import Optional
 
 
 @dataclass(frozen=True)
@@ -14,6 +15,19 @@ def _to_bytes(s: str) -> bytes:
     return s.encode("utf-8", errors="replace")
 
 
+@lru_cache(maxsize=32)
+def _prefix_hasher(label: str, salt: str) -> "hashlib._Hash":
+    # The "analytics_pixel:v1:<label>:<salt>:" prefix is fixed per (label, salt),
+    # so hash it once and hand out copies of the midstate.
+    h = hashlib.sha256()
+    h.update(_to_bytes("analytics_pixel:v1:"))
+    h.update(_to_bytes(label))
+    h.update(b":")
+    h.update(_to_bytes(salt))
+    h.update(b":")
+    return h
+
+
 def sha256_hex(cfg: HashingConfig, *, label: str, value: Optional[str]) -> Optional[str]:
     """
     One-way hash for sensitive fields. Never store raw values to disk.
@@ -28,12 +42,7 @@ def sha256_hex(cfg: HashingConfig, *, label: str, value: Optional[str]) -> Optio
     if not v:
         return None
 
-    h = hashlib.sha256()
-    h.update(_to_bytes("analytics_pixel:v1:"))
-    h.update(_to_bytes(label))
-    h.update(b":")
-    h.update(_to_bytes(cfg.salt))
-    h.update(b":")
+    h = _prefix_hasher(label, cfg.salt).copy()
     h.update(_to_bytes(v))
     return h.hexdigest()
 
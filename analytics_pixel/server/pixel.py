@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import io
-from typing import Optional
 
 
 # 1×1 transparent PNG (hardcoded, valid)
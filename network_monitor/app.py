@@ -1,12 +1,13 @@
 import eventlet
 eventlet.monkey_patch()
 
-from flask import Flask, render_template, request
+from flask import Flask, render_template
 from flask_socketio import SocketIO, emit
-from scapy.all import sniff, IP, TCP, UDP, Raw, conf
+from scapy.all import AsyncSniffer, IP, Raw
+from scapy.error import Scapy_Exception
+import ipaddress
 import threading
 import time
-import json
 import base64
 import logging
 
@@ -20,72 +21,147 @@ socketio = SocketIO(app, async_mode='eventlet', cors_allowed_origins="*")
 
 # Global control variables
 sniffing = True
-# Simple string filter for IP presence (source or dest)
-target_ip_filter = "" 
+# Running AsyncSniffer; restarted whenever the BPF filter changes
+sniffer = None
+# Set by the running sniffer's started_callback once it can be stopped
+sniffer_started = None
+# How long a restart waits for the previous sniffer to finish starting
+SNIFFER_START_TIMEOUT = 5.0
+# Serializes sniffer restarts: each Socket.IO event runs in its own greenlet and
+# stopping the old sniffer yields, so overlapping set_filter calls could
+# otherwise both stop the same sniffer and each start (and orphan) a new one.
+sniffer_lock = threading.Lock()
+# IP protocol number -> display name
+PROTOCOL_NAMES = {6: "TCP", 17: "UDP", 1: "ICMP"}
+# [epoch second, formatted '%H:%M:%S'] for the most recent packet
+timestamp_cache = [0, ""]
+# Packets waiting to be sent to clients as one 'new_packets' batch
+pending_packets = []
+pending_event = threading.Event()
+# How long the flusher lets a burst accumulate before emitting it
+EMIT_INTERVAL = 0.05
+
+def current_timestamp():
+    # The formatted time only changes once per second, so reuse it across
+    # all packets captured within the same second.
+    now = int(time.time())
+    if now != timestamp_cache[0]:
+        timestamp_cache[1] = time.strftime('%H:%M:%S', time.localtime(now))
+        timestamp_cache[0] = now
+    return timestamp_cache[1]
 
 def packet_callback(packet):
-    global target_ip_filter, sniffing
-    
     if not sniffing:
         return
 
-    if IP in packet:
-        src_ip = packet[IP].src
-        dst_ip = packet[IP].dst
-        
-        # Filter logic: if filter is set, one of the IPs must match
-        if target_ip_filter and (target_ip_filter != src_ip and target_ip_filter != dst_ip):
-            return
+    # Look each layer up once and reuse the reference
+    ip = packet.getlayer(IP)
+    if ip is not None:
+        src_ip = ip.src
+        dst_ip = ip.dst
+
+        protocol = PROTOCOL_NAMES.get(ip.proto, "OTHER")
+
+        # Extract L7 payload; it is decoded by the flusher, off the capture path
+        raw = packet.getlayer(Raw)
+        raw_bytes = raw.load if raw is not None else b""
+        length = len(packet)
 
-        proto_num = packet[IP].proto
-        protocol = "OTHER"
-        if proto_num == 6:
-            protocol = "TCP"
-        elif proto_num == 17:
-            protocol = "UDP"
-        elif proto_num == 1:
-            protocol = "ICMP"
-
-        payload = ""
-        is_plain_text = False
-        raw_bytes = b""
-        
-        # Extract L7 payload
-        if Raw in packet:
-            raw_bytes = packet[Raw].load
-            try:
-                # Try to decode as UTF-8 for "plain text"
-                payload = raw_bytes.decode('utf-8')
-                is_plain_text = True
-            except UnicodeDecodeError:
-                # If binary, we encode it as base64 so it can be sent to JSON
-                # The frontend can then decide to show it as Hex or try other decodings
-                payload = base64.b64encode(raw_bytes).decode('utf-8')
-                is_plain_text = False
-        
         pkt_data = {
-            'timestamp': time.strftime('%H:%M:%S', time.localtime()),
+            'timestamp': current_timestamp(),
             'src': src_ip,
             'dst': dst_ip,
             'protocol': protocol,
-            'length': len(packet),
-            'payload': payload,
-            'is_plain_text': is_plain_text,
-            'summary': packet.summary()
+            'length': length,
+            'payload': raw_bytes,
+            # Built from the fields above; packet.summary() re-walks every layer
+            'summary': f"{protocol} {src_ip} > {dst_ip} len={length}"
         }
-        
-        socketio.emit('new_packet', pkt_data)
-        eventlet.sleep(0) # Yield to eventlet loop
 
-def start_sniffing():
-    logger.info("Starting packet sniffer...")
-    # store=0 prevents memory buildup
-    # filter="ip" ensures we only look at IP packets (IPv4)
-    sniff(prn=packet_callback, filter="ip", store=0)
+        pending_packets.append(pkt_data)
+        pending_event.set()
 
-# Start sniffer in a separate thread
-# Note: In a production environment with eventlet, we prefer eventlet.spawn
-sniffer_thread = eventlet.spawn(start_sniffing)
+def encode_payload(raw_bytes):
+    # Returns (payload, is_plain_text) for the JSON sent to the browser
+    if not raw_bytes:
+        return "", False
+    if raw_bytes.isascii():
+        return raw_bytes.decode('ascii'), True
+    try:
+        # Try to decode as UTF-8 for "plain text"
+        return raw_bytes.decode('utf-8'), True
+    except UnicodeDecodeError:
+        # If binary, we encode it as base64 so it can be sent to JSON
+        # The frontend can then decide to show it as Hex or try other decodings
+        return base64.b64encode(raw_bytes).decode('ascii'), False
+
+def flush_packets():
+    # Emit queued packets as one Socket.IO event per burst instead of one
+    # WebSocket frame per packet. Sleeps on the event while idle.
+    global pending_packets
+    while True:
+        pending_event.wait()
+        pending_event.clear()
+        eventlet.sleep(EMIT_INTERVAL)
+        batch, pending_packets = pending_packets, []
+        if not batch:
+            continue
+        # This is the only flusher; a bad batch must not kill it, or the UI
+        # stops updating and pending_packets grows without bound.
+        try:
+            for pkt_data in batch:
+                pkt_data['payload'], pkt_data['is_plain_text'] = encode_payload(pkt_data['payload'])
+            socketio.emit('new_packets', batch)
+        except Exception:
+            logger.exception(f"Dropping batch of {len(batch)} packets")
+
+def build_bpf_filter(ip):
+    # filter="ip" ensures we only look at IP packets (IPv4).
+    # A host filter lets the kernel drop non-matching packets before Scapy
+    # ever copies or dissects them.
+    if not ip:
+        return "ip"
+    return f"ip and host {ip}"
+
+def stop_sniffer(old, started):
+    thread = old.thread
+    if thread is None:
+        return
+    # AsyncSniffer only installs its stop callback after opening the socket and
+    # compiling the BPF filter (which can yield under eventlet); started_callback
+    # fires right after that, so wait for it before calling stop().
+    deadline = time.monotonic() + SNIFFER_START_TIMEOUT
+    while not started.wait(0.1):
+        if not thread.is_alive():
+            return
+        if time.monotonic() >= deadline:
+            logger.warning("Previous sniffer did not start in time; leaving it running")
+            return
+    try:
+        old.stop()
+    except Scapy_Exception:
+        logger.exception("Failed to stop previous sniffer")
+
+def start_sniffing(ip=""):
+    global sniffer, sniffer_started
+    with sniffer_lock:
+        if sniffer is not None:
+            old, old_started = sniffer, sniffer_started
+            sniffer = sniffer_started = None
+            stop_sniffer(old, old_started)
+        bpf_filter = build_bpf_filter(ip)
+        logger.info(f"Starting packet sniffer (filter: {bpf_filter})...")
+        started = threading.Event()
+        # store=False prevents memory buildup
+        new_sniffer = AsyncSniffer(
+            prn=packet_callback, filter=bpf_filter, store=False, started_callback=started.set
+        )
+        new_sniffer.start()
+        sniffer, sniffer_started = new_sniffer, started
+
+# Start sniffer in the background (a green thread under eventlet.monkey_patch)
+start_sniffing()
+flusher_thread = eventlet.spawn(flush_packets)
 
 @app.route('/')
 def index():
@@ -97,9 +173,16 @@ def test_connect():
 
 @socketio.on('set_filter')
 def handle_filter(data):
-    global target_ip_filter
-    target_ip_filter = data.get('ip', '').strip()
-    emit('status', {'msg': f'Filter set to: {target_ip_filter if target_ip_filter else "None"}'})
+    ip = data.get('ip', '').strip()
+    if ip:
+        # Validate before the value is spliced into the BPF expression
+        try:
+            ip = str(ipaddress.IPv4Address(ip))
+        except ValueError:
+            emit('status', {'msg': f'Invalid IPv4 address: {ip}'})
+            return
+    start_sniffing(ip)
+    emit('status', {'msg': f'Filter set to: {ip if ip else "None"}'})
 
 @socketio.on('toggle_sniffing')
 def handle_toggle(data):
@@ -32,10 +32,10 @@ import sqlite3
 import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from http import HTTPStatus
+from functools import lru_cache
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from urllib.parse import parse_qs, unquote, urlparse
 
 
@@ -49,6 +49,8 @@ PIXEL_PNG_BYTES = base64.b64decode(
 )
 
 
+# Hit lists and timelines re-format the same epoch seconds on every poll.
+@lru_cache(maxsize=4096)
 def utc_iso(ts: int) -> str:
     return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
 
@@ -75,8 +77,15 @@ def json_response(handler: BaseHTTPRequestHandler, obj: Any, *, status: int = 20
     handler.wfile.write(data)
 
 
-def text_response(handler: BaseHTTPRequestHandler, text: str, *, status: int = 200, content_type: str = "text/plain") -> None:
-    data = text.encode("utf-8")
+def text_response(
+    handler: BaseHTTPRequestHandler,
+    text: Union[str, bytes],
+    *,
+    status: int = 200,
+    content_type: str = "text/plain",
+) -> None:
+    # Accepts already-encoded UTF-8 bytes so static assets are encoded only once.
+    data = text if isinstance(text, bytes) else text.encode("utf-8")
     handler.send_response(status)
     handler.send_header("Content-Type", f"{content_type}; charset=utf-8")
     handler.send_header("Cache-Control", "no-store")
@@ -115,6 +124,24 @@ def read_json_body(handler: BaseHTTPRequestHandler, *, max_bytes: int = 64_000)
     return json.loads(raw.decode("utf-8"))
 
 
+# Request headers safe_header_subset() may keep, built once at import.
+SAFE_HEADER_NAMES: Tuple[str, ...] = (
+    "User-Agent",
+    "Accept",
+    "Accept-Language",
+    "Accept-Encoding",
+    "DNT",
+    "Sec-Fetch-Site",
+    "Sec-Fetch-Mode",
+    "Sec-Fetch-Dest",
+    "Sec-Ch-Ua",
+    "Sec-Ch-Ua-Mobile",
+    "Sec-Ch-Ua-Platform",
+    "Origin",
+    "Referer",
+)
+
+
 def safe_header_subset(headers: Any) -> Dict[str, str]:
     """
     Keep a safe, non-identifying subset of request headers.
@@ -122,24 +149,8 @@ def safe_header_subset(headers: Any) -> Dict[str, str]:
     Never record cookies, auth, or proxy/ip-related headers.
     """
 
-    allow = {
-        "User-Agent",
-        "Accept",
-        "Accept-Language",
-        "Accept-Encoding",
-        "DNT",
-        "Sec-Fetch-Site",
-        "Sec-Fetch-Mode",
-        "Sec-Fetch-Dest",
-        "Sec-Ch-Ua",
-        "Sec-Ch-Ua-Mobile",
-        "Sec-Ch-Ua-Platform",
-        "Origin",
-        "Referer",
-    }
-
     out: Dict[str, str] = {}
-    for k in allow:
+    for k in SAFE_HEADER_NAMES:
         v = headers.get(k)
         if v is None:
             continue
@@ -254,12 +265,11 @@ def beacon_exists(db_path: str, beacon_id: str) -> bool:
     return row is not None
 
 
-def ensure_beacon(db_path: str, beacon_id: str) -> None:
-    with connect_db(db_path) as con:
-        con.execute(
-            "INSERT OR IGNORE INTO beacons(beacon_id, label, created_ts) VALUES (?, '', ?)",
-            (beacon_id, now_ts()),
-        )
+def ensure_beacon(con: sqlite3.Connection, beacon_id: str, ts: int) -> None:
+    con.execute(
+        "INSERT OR IGNORE INTO beacons(beacon_id, label, created_ts) VALUES (?, '', ?)",
+        (beacon_id, ts),
+    )
 
 
 def create_beacon(db_path: str, *, label: str = "") -> str:
@@ -290,15 +300,15 @@ def log_hit(
     if cfg.require_registered_beacons and not beacon_exists(db_path, beacon_id):
         return
 
-    # Keep the system usable without an explicit "create" step.
-    ensure_beacon(db_path, beacon_id)
-
     referrer_n = normalize_url_for_storage(referrer, store_full=cfg.store_full_urls)
     page_n = normalize_url_for_storage(page_url, store_full=cfg.store_full_urls)
     ua = (user_agent or "")[:1024]
     headers_json = json.dumps(headers_subset, ensure_ascii=False, separators=(",", ":"))
 
     with connect_db(db_path) as con:
+        # Keep the system usable without an explicit "create" step. Registered in
+        # the same transaction as the hit instead of a separate connection.
+        ensure_beacon(con, beacon_id, ts)
         con.execute(
             """
             INSERT INTO hits(
@@ -371,7 +381,18 @@ def query_beacons(db_path: str) -> List[Dict[str, Any]]:
     return out
 
 
-def query_hits(db_path: str, *, beacon_id: str, limit: int, offset: int) -> List[Dict[str, Any]]:
+def query_hits(
+    db_path: str,
+    *,
+    beacon_id: str,
+    limit: int,
+    offset: int,
+    parse_headers: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    parse_headers=False returns the stored compact JSON under "headers_json"
+    instead of a decoded "headers" dict (the CSV export writes it verbatim).
+    """
     limit = clamp_int(limit, 1, 2000)
     offset = clamp_int(offset, 0, 2_000_000)
     params: List[Any] = []
@@ -392,22 +413,24 @@ def query_hits(db_path: str, *, beacon_id: str, limit: int, offset: int) -> List
     out: List[Dict[str, Any]] = []
     for r in rows:
         ts = int(r["ts"])
-        out.append(
-            {
-                "hit_id": int(r["hit_id"]),
-                "ts": ts,
-                "ts_iso": utc_iso(ts),
-                "beacon_id": r["beacon_id"],
-                "hit_type": r["hit_type"],
-                "origin_type": r["origin_type"],
-                "user_agent": r["user_agent"],
-                "referrer": r["referrer"],
-                "page_url": r["page_url"],
-                "screen_w": r["screen_w"],
-                "screen_h": r["screen_h"],
-                "headers": json.loads(r["headers_json"] or "{}"),
-            }
-        )
+        hit: Dict[str, Any] = {
+            "hit_id": int(r["hit_id"]),
+            "ts": ts,
+            "ts_iso": utc_iso(ts),
+            "beacon_id": r["beacon_id"],
+            "hit_type": r["hit_type"],
+            "origin_type": r["origin_type"],
+            "user_agent": r["user_agent"],
+            "referrer": r["referrer"],
+            "page_url": r["page_url"],
+            "screen_w": r["screen_w"],
+            "screen_h": r["screen_h"],
+        }
+        if parse_headers:
+            hit["headers"] = json.loads(r["headers_json"] or "{}")
+        else:
+            hit["headers_json"] = r["headers_json"] or "{}"
+        out.append(hit)
     return out
 
 
@@ -449,6 +472,21 @@ def query_timeline(db_path: str, *, beacon_id: str, bucket: str, buckets: int) -
     return out
 
 
+EXPORT_CSV_COLUMNS: Tuple[str, ...] = (
+    "hit_id",
+    "ts_iso",
+    "beacon_id",
+    "hit_type",
+    "origin_type",
+    "page_url",
+    "referrer",
+    "screen_w",
+    "screen_h",
+    "user_agent",
+    "headers_json",
+)
+
+
 def build_embed_examples(base_url: str, beacon_id: str) -> Dict[str, str]:
     base = base_url.rstrip("/")
     return {
@@ -796,6 +834,13 @@ def js_beacon_payload() -> str:
 })();"""
 
 
+# Static responses, UTF-8 encoded once at import instead of on every request.
+DASHBOARD_HTML_BYTES = dashboard_html().encode("utf-8")
+DASHBOARD_JS_BYTES = dashboard_js().encode("utf-8")
+DASHBOARD_CSS_BYTES = dashboard_css().encode("utf-8")
+JS_BEACON_BYTES = js_beacon_payload().encode("utf-8")
+
+
 class PrivacyBeaconHandler(BaseHTTPRequestHandler):
     server_version = "PrivacyBeacon/1.0"
 
@@ -863,95 +908,99 @@ class PrivacyBeaconHandler(BaseHTTPRequestHandler):
 
         bytes_response(self, PIXEL_PNG_BYTES, content_type="image/png")
 
-    def do_GET(self) -> None:  # noqa: N802
-        path, qs = self._route()
-
-        # Dashboard + static assets
-        if path == "/" or path == "/dashboard":
-            text_response(self, dashboard_html(), content_type="text/html", status=200)
-            return
-        if path == "/dashboard/app.js":
-            text_response(self, dashboard_js(), content_type="application/javascript", status=200)
-            return
-        if path == "/dashboard/styles.css":
-            text_response(self, dashboard_css(), content_type="text/css", status=200)
-            return
-
-        # API
-        if path == "/api/stats":
-            json_response(self, query_stats(self.db_path))
-            return
-        if path == "/api/beacons":
-            json_response(self, {"beacons": query_beacons(self.db_path)})
-            return
-        if path == "/api/hits":
-            beacon_id = (qs.get("beacon") or ["all"])[0]
-            limit = clamp_int((qs.get("limit") or ["250"])[0], 1, 2000)
-            offset = clamp_int((qs.get("offset") or ["0"])[0], 0, 2_000_000)
-            json_response(self, {"hits": query_hits(self.db_path, beacon_id=beacon_id, limit=limit, offset=offset)})
-            return
-        if path == "/api/timeline":
-            beacon_id = (qs.get("beacon") or ["all"])[0]
-            bucket = (qs.get("bucket") or ["hour"])[0]
-            buckets = clamp_int((qs.get("buckets") or ["168"])[0], 1, 24 * 31)
-            json_response(self, {"series": query_timeline(self.db_path, beacon_id=beacon_id, bucket=bucket, buckets=buckets)})
-            return
-        if path == "/api/embed":
-            beacon_id = (qs.get("beacon") or ["all"])[0]
-            if not beacon_id or beacon_id == "all":
-                # Try to pick top beacon; otherwise create one.
-                beacons = query_beacons(self.db_path)
-                if beacons:
-                    beacon_id = beacons[0]["beacon_id"]
-                else:
-                    beacon_id = create_beacon(self.db_path, label="")
-            json_response(self, {"beacon_id": beacon_id, "examples": build_embed_examples(self._base_url(), beacon_id)})
-            return
-
-        if path == "/export.csv":
-            beacon_id = (qs.get("beacon") or ["all"])[0]
-            hits = query_hits(self.db_path, beacon_id=beacon_id, limit=2000, offset=0)
-            buf = io.StringIO()
-            w = csv.writer(buf)
-            w.writerow(
+    # -------- exact-path GET routes (dispatched via _GET_ROUTES) --------
+    def _get_dashboard_html(self, qs: Dict[str, List[str]]) -> None:
+        text_response(self, DASHBOARD_HTML_BYTES, content_type="text/html", status=200)
+
+    def _get_dashboard_js(self, qs: Dict[str, List[str]]) -> None:
+        text_response(self, DASHBOARD_JS_BYTES, content_type="application/javascript", status=200)
+
+    def _get_dashboard_css(self, qs: Dict[str, List[str]]) -> None:
+        text_response(self, DASHBOARD_CSS_BYTES, content_type="text/css", status=200)
+
+    def _get_api_stats(self, qs: Dict[str, List[str]]) -> None:
+        json_response(self, query_stats(self.db_path))
+
+    def _get_api_beacons(self, qs: Dict[str, List[str]]) -> None:
+        json_response(self, {"beacons": query_beacons(self.db_path)})
+
+    def _get_api_hits(self, qs: Dict[str, List[str]]) -> None:
+        beacon_id = (qs.get("beacon") or ["all"])[0]
+        limit = clamp_int((qs.get("limit") or ["250"])[0], 1, 2000)
+        offset = clamp_int((qs.get("offset") or ["0"])[0], 0, 2_000_000)
+        json_response(self, {"hits": query_hits(self.db_path, beacon_id=beacon_id, limit=limit, offset=offset)})
+
+    def _get_api_timeline(self, qs: Dict[str, List[str]]) -> None:
+        beacon_id = (qs.get("beacon") or ["all"])[0]
+        bucket = (qs.get("bucket") or ["hour"])[0]
+        buckets = clamp_int((qs.get("buckets") or ["168"])[0], 1, 24 * 31)
+        json_response(self, {"series": query_timeline(self.db_path, beacon_id=beacon_id, bucket=bucket, buckets=buckets)})
+
+    def _get_api_embed(self, qs: Dict[str, List[str]]) -> None:
+        beacon_id = (qs.get("beacon") or ["all"])[0]
+        if not beacon_id or beacon_id == "all":
+            # Try to pick top beacon; otherwise create one.
+            beacons = query_beacons(self.db_path)
+            if beacons:
+                beacon_id = beacons[0]["beacon_id"]
+            else:
+                beacon_id = create_beacon(self.db_path, label="")
+        json_response(self, {"beacon_id": beacon_id, "examples": build_embed_examples(self._base_url(), beacon_id)})
+
+    def _get_export_csv(self, qs: Dict[str, List[str]]) -> None:
+        beacon_id = (qs.get("beacon") or ["all"])[0]
+        hits = query_hits(self.db_path, beacon_id=beacon_id, limit=2000, offset=0, parse_headers=False)
+        buf = io.StringIO()
+        writerow = csv.writer(buf).writerow
+        writerow(EXPORT_CSV_COLUMNS)
+        for h in hits:
+            # headers_json is stored with the same compact dumps() settings,
+            # so it is written as-is rather than decoded and re-encoded.
+            writerow(
                 [
-                    "hit_id",
-                    "ts_iso",
-                    "beacon_id",
-                    "hit_type",
-                    "origin_type",
-                    "page_url",
-                    "referrer",
-                    "screen_w",
-                    "screen_h",
-                    "user_agent",
-                    "headers_json",
+                    h["hit_id"],
+                    h["ts_iso"],
+                    h["beacon_id"],
+                    h["hit_type"],
+                    h["origin_type"],
+                    h["page_url"],
+                    h["referrer"],
+                    h["screen_w"] if h["screen_w"] is not None else "",
+                    h["screen_h"] if h["screen_h"] is not None else "",
+                    h["user_agent"],
+                    h["headers_json"],
                 ]
             )
-            for h in hits:
-                w.writerow(
-                    [
-                        h["hit_id"],
-                        h["ts_iso"],
-                        h["beacon_id"],
-                        h["hit_type"],
-                        h["origin_type"],
-                        h["page_url"],
-                        h["referrer"],
-                        h["screen_w"] if h["screen_w"] is not None else "",
-                        h["screen_h"] if h["screen_h"] is not None else "",
-                        h["user_agent"],
-                        json.dumps(h["headers"], ensure_ascii=False, separators=(",", ":")),
-                    ]
-                )
-            data = buf.getvalue().encode("utf-8")
-            self.send_response(200)
-            self.send_header("Content-Type", "text/csv; charset=utf-8")
-            self.send_header("Cache-Control", "no-store")
-            self.send_header("Content-Disposition", f'attachment; filename="privacy_beacon_hits_{beacon_id}.csv"')
-            self.send_header("Content-Length", str(len(data)))
-            self.end_headers()
-            self.wfile.write(data)
+        data = buf.getvalue().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/csv; charset=utf-8")
+        self.send_header("Cache-Control", "no-store")
+        self.send_header("Content-Disposition", f'attachment; filename="privacy_beacon_hits_{beacon_id}.csv"')
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    # One dict lookup instead of a chain of path comparisons ahead of the beacon routes.
+    _GET_ROUTES: Dict[str, Callable[["PrivacyBeaconHandler", Dict[str, List[str]]], None]] = {
+        "/": _get_dashboard_html,
+        "/dashboard": _get_dashboard_html,
+        "/dashboard/app.js": _get_dashboard_js,
+        "/dashboard/styles.css": _get_dashboard_css,
+        "/api/stats": _get_api_stats,
+        "/api/beacons": _get_api_beacons,
+        "/api/hits": _get_api_hits,
+        "/api/timeline": _get_api_timeline,
+        "/api/embed": _get_api_embed,
+        "/export.csv": _get_export_csv,
+    }
+
+    def do_GET(self) -> None:  # noqa: N802
+        path, qs = self._route()
+
+        # Dashboard, static assets, API and export
+        route = self._GET_ROUTES.get(path)
+        if route is not None:
+            route(self, qs)
             return
 
         # Beacons
@@ -1000,8 +1049,7 @@ class PrivacyBeaconHandler(BaseHTTPRequestHandler):
                 self._send_404()
                 return
             # JS file itself does not count as a hit; it triggers a single metadata image hit.
-            body = js_beacon_payload()
-            text_response(self, body, content_type="application/javascript", status=200)
+            text_response(self, JS_BEACON_BYTES, content_type="application/javascript", status=200)
             return
 
         if path.startswith("/b/") and path.count("/") == 2 and not path.endswith((".png", ".js", ".txt")):